@@ -1,4 +1,19 @@
-from setuptools import setup, find_packages
+import os
+
+from setuptools import setup, find_packages, Extension
+
+# Optional compiled scanner; the package falls back to pure Python without it.
+ext_modules = []
+if os.name != "nt":
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        pass
+    else:
+        ext_modules = cythonize(
+            [Extension("pychkr._scan", ["src/pychkr/_scan.pyx"], optional=True)],
+            language_level=3,
+        )
 
 setup(
     name="pychkr",
@@ -12,6 +27,10 @@ setup(
     version="0.1.1",
     package_dir={"": "src"},
     packages=find_packages(where="src"),
+    ext_modules=ext_modules,
+    extras_require={
+        "fast": ["orjson"],
+    },
     entry_points={
         "console_scripts": [
             "pychkr=pychkr.main:main",
@@ -0,0 +1,80 @@
+# cython: language_level=3
+"""
+Compiled bind-probe loop used by PortChecker when available (POSIX only).
+"""
+
+from libc.string cimport memcpy, memset
+from posix.unistd cimport close
+
+
+cdef extern from "<sys/socket.h>" nogil:
+    ctypedef unsigned int socklen_t
+
+    struct sockaddr:
+        pass
+
+    int AF_INET
+    int SOCK_STREAM
+    int SOL_SOCKET
+    int SO_REUSEADDR
+
+    int socket(int domain, int type, int protocol)
+    int setsockopt(int fd, int level, int optname, const void *optval, socklen_t optlen)
+    int bind(int fd, const sockaddr *addr, socklen_t addrlen)
+
+
+cdef extern from "<netinet/in.h>" nogil:
+    struct in_addr:
+        pass
+
+    struct sockaddr_in:
+        unsigned short sin_family
+        unsigned short sin_port
+        in_addr sin_addr
+
+
+cdef extern from "<arpa/inet.h>" nogil:
+    unsigned short htons(unsigned short hostshort)
+
+
+def scan_bind_range(int start, int end, bytes host):
+    """
+    Try to bind every port in a range, without holding the GIL.
+
+    Args:
+        start: Starting port number
+        end: Ending port number (inclusive)
+        host: Packed IPv4 address to bind to, as returned by socket.inet_aton
+
+    Returns:
+        bytearray with one byte per port: 1 if bindable, 0 otherwise
+    """
+    if len(host) != 4:
+        raise ValueError("host must be a packed IPv4 address")
+    if start < 0 or end > 65535:
+        raise ValueError("Ports must be between 0 and 65535")
+    if start > end:
+        return bytearray()
+
+    cdef bytearray result = bytearray(end - start + 1)
+    cdef unsigned char *out = result
+    cdef const char *packed = host
+    cdef sockaddr_in addr
+    cdef int port, fd
+    cdef int one = 1
+
+    memset(&addr, 0, sizeof(addr))
+    addr.sin_family = AF_INET
+    memcpy(&addr.sin_addr, packed, 4)
+
+    with nogil:
+        for port in range(start, end + 1):
+            fd = socket(AF_INET, SOCK_STREAM, 0)
+            if fd < 0:
+                continue
+            setsockopt(fd, SOL_SOCKET, SO_REUSEADDR, &one, sizeof(one))
+            addr.sin_port = htons(<unsigned short>port)
+            out[port - start] = bind(fd, <sockaddr *>&addr, sizeof(addr)) == 0
+            close(fd)
+
+    return result
@@ -4,19 +4,190 @@ Port Checker - A utility to check port availability on the local system.
 """
 
 import argparse
+import array
+import errno
 import socket
+import struct
 import sys
 import json
+import threading
+import random
+import selectors
 import time
-from typing import Tuple, List, Optional, Dict
+import types
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import compress, islice
+from typing import Tuple, List, Optional, Dict, Sequence, Literal
 from datetime import datetime
 
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+try:
+    from . import _scan
+except ImportError:  # Compiled scanner not built; use the pure-Python probe
+    _scan = None
+
+try:
+    import orjson
+except ImportError:  # Optional, installed with the "fast" extra
+    orjson = None
+
+
+# Well-known service ports checked by --common, in ascending port order
+COMMON_PORTS = types.MappingProxyType({
+    20: "FTP Data", 21: "FTP Control", 22: "SSH", 23: "Telnet",
+    25: "SMTP", 53: "DNS", 80: "HTTP", 110: "POP3", 143: "IMAP",
+    443: "HTTPS", 465: "SMTPS", 587: "SMTP (submission)",
+    993: "IMAPS", 995: "POP3S", 3306: "MySQL", 5432: "PostgreSQL",
+    6379: "Redis", 8080: "HTTP Alt", 27017: "MongoDB"
+})
+
+# Upper bound on concurrent port checks; bind() releases the GIL, so the
+# scan is bounded by syscall latency rather than the interpreter.
+MAX_SCAN_WORKERS = 512
+
+# Ports handed to a worker at a time. A local bind() takes microseconds, so
+# per-port futures would cost more than the probes themselves.
+SCAN_CHUNK_SIZE = 256
+
+# Extra chunks find_available_ports keeps in flight beyond those needed to
+# cover the requested count if every port were free. The window doubles
+# each time a consumed chunk leaves the count short, up to MAX_SCAN_WORKERS.
+FIND_LOOKAHEAD_CHUNKS = 2
+
+# Number of connection probes in flight at once; each batch is submitted
+# together and reaped together, keeping open descriptors bounded. Windows
+# select() is limited to 512 sockets per call.
+PROBE_BATCH_SIZE = 500 if sys.platform == "win32" else 1024
+
+# Descriptors left free when sizing probe batches against RLIMIT_NOFILE,
+# for stdio and whatever else the process has open.
+_FD_HEADROOM = 64
+
+# SO_LINGER with a zero timeout: closing a connected probe sends RST instead
+# of FIN, so probing listeners leaves no client sockets behind in TIME_WAIT.
+_LINGER_RESET = struct.pack("HH" if sys.platform == "win32" else "ii", 1, 0)
+
+# Bind failures that may hide a listener worth a connection probe: the port
+# is taken, or it is privileged and bindability can't tell us either way.
+# Windows sockets report the WSA* variants of these codes.
+_PROBE_ERRNOS = frozenset(
+    getattr(errno, name)
+    for name in ("EADDRINUSE", "EACCES", "WSAEADDRINUSE", "WSAEACCES")
+    if hasattr(errno, name)
+)
+
+# connect_ex() results meaning a non-blocking connect is still in progress
+_CONNECT_PENDING_ERRNOS = frozenset(
+    getattr(errno, name)
+    for name in ("EINPROGRESS", "EWOULDBLOCK", "EAGAIN", "WSAEWOULDBLOCK")
+    if hasattr(errno, name)
+)
+
+# Reuse option for the bind probe. On POSIX, SO_REUSEADDR lets the probe
+# bind over connections lingering in TIME_WAIT, so those ports aren't
+# reported as in use. On Windows, SO_REUSEADDR would let it bind over an
+# active listener instead; SO_EXCLUSIVEADDRUSE gives the POSIX semantics.
+# SO_REUSEPORT is deliberately not set: it would let the probe share ports
+# with servers that listen using SO_REUSEPORT and report them as free.
+_BIND_REUSE_OPTION = getattr(socket, "SO_EXCLUSIVEADDRUSE", socket.SO_REUSEADDR)
+
+# Byte translation table swapping 0 and 1 in a scan result buffer
+_INVERT_BITMAP = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+
+
+def _raise_fd_limit(needed: int) -> int:
+    """
+    Raise the soft open-file limit so a batch of sockets fits, where supported.
+    
+    Args:
+        needed: Number of sockets the caller wants open at once
+        
+    Returns:
+        Number of sockets, at most needed, that the resulting limit leaves room for
+    """
+    if resource is None:
+        return needed
+    
+    try:
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    except (ValueError, OSError):
+        return needed
+    
+    try:
+        wanted = needed + _FD_HEADROOM
+        if hard != resource.RLIM_INFINITY:
+            wanted = min(wanted, hard)
+        if soft != resource.RLIM_INFINITY and wanted > soft:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (wanted, hard))
+            soft = wanted
+    except (ValueError, OSError):
+        pass
+    
+    if soft == resource.RLIM_INFINITY:
+        return needed
+    return max(1, min(needed, soft - _FD_HEADROOM))
+
+
+def _chunk_range(start: int, end: int) -> List[range]:
+    """Split an inclusive port range into runs of SCAN_CHUNK_SIZE ports."""
+    return [range(port, min(port + SCAN_CHUNK_SIZE, end + 1))
+            for port in range(start, end + 1, SCAN_CHUNK_SIZE)]
+
+
+def _load_services(path: str = "/etc/services") -> Optional[Dict[int, str]]:
+    """
+    Parse a services database into a port -> service name mapping.
+    
+    Args:
+        path: Path to the services file
+        
+    Returns:
+        Service mapping, or None if the file cannot be read
+    """
+    services = {}
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                fields = line.split("#", 1)[0].split()
+                if len(fields) < 2 or "/" not in fields[1]:
+                    continue
+                port = fields[1].split("/", 1)[0]
+                if port.isdigit():
+                    # Keep the first entry for any protocol, as getservbyport() does
+                    services.setdefault(int(port), fields[0])
+    except OSError:
+        return None
+    return services
+
+
+@lru_cache(maxsize=None)
+def _getservbyport(port: int) -> Optional[str]:
+    """Cached socket.getservbyport() for systems without /etc/services."""
+    try:
+        return socket.getservbyport(port)
+    except OSError:
+        return None
+
 
 class PortChecker:  
     """Handles port availability checking operations."""
     
     def __init__(self, host: str = "0.0.0.0"):
         self.host = host
+        self._connect_host = host if host != "0.0.0.0" else "127.0.0.1"
+        self._services = _load_services()
+        self._packed_host = None
+        if _scan is not None:
+            try:
+                self._packed_host = socket.inet_aton(socket.gethostbyname(host))
+            except OSError:
+                pass
     
     def is_port_available(self, port: int) -> bool:
         """
@@ -28,13 +199,32 @@ class PortChecker:
         Returns:
             True if port is available, False otherwise
         """
+        return self._bind_error(port) is None
+    
+    def _bind_error(self, port: int) -> Optional[int]:
+        """
+        Try to bind a port and report why it failed.
+        
+        Args:
+            port: Port number to bind
+            
+        Returns:
+            None if the bind succeeded, otherwise the errno of the failure
+        """
+        # Plain try/finally rather than a with-block: this runs once per
+        # scanned port, and the context manager protocol costs a frame each.
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                sock.bind((self.host, port))
-                return True
-        except (OSError, PermissionError):
-            return False
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        except OSError as e:
+            return e.errno
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, _BIND_REUSE_OPTION, 1)
+            sock.bind((self.host, port))
+        except OSError as e:
+            return e.errno
+        finally:
+            sock.close()
+        return None
     
     def get_service_name(self, port: int) -> Optional[str]:
         """
@@ -46,10 +236,9 @@ class PortChecker:
         Returns:
             Service name or None
         """
-        try:
-            return socket.getservbyport(port)
-        except OSError:
-            return None
+        if self._services is None:
+            return _getservbyport(port)
+        return self._services.get(port)
     
     def check_port_connection(self, port: int, timeout: float = 1.0) -> bool:
         """
@@ -64,26 +253,100 @@ class PortChecker:
         """
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RESET)
                 sock.settimeout(timeout)
-                result = sock.connect_ex((self.host if self.host != "0.0.0.0" else "127.0.0.1", port))
+                result = sock.connect_ex((self._connect_host, port))
                 return result == 0
         except Exception:
             return False
     
-    def get_port_info(self, port: int) -> Dict[str, any]:
+    def check_ports_connection(self, ports: Sequence[int], timeout: float = 1.0) -> Dict[int, bool]:
+        """
+        Check several ports for listening services concurrently.
+        
+        Non-blocking connects are issued in batches of PROBE_BATCH_SIZE and
+        every batch shares one selector wait, so each batch waits at most one
+        timeout rather than one per port.
+        
+        Args:
+            ports: Port numbers to check
+            timeout: Connection timeout in seconds
+            
+        Returns:
+            Dictionary mapping each port to True if a service is listening
+        """
+        results = dict.fromkeys(ports, False)
+        if not ports:
+            return results
+        
+        # Never open more sockets at once than the descriptor limit allows
+        batch_size = _raise_fd_limit(min(PROBE_BATCH_SIZE, len(ports)))
+        try:
+            # Resolve once up front instead of once per probe
+            host = socket.gethostbyname(self._connect_host)
+        except OSError:
+            return results
+        
+        for i in range(0, len(ports), batch_size):
+            with selectors.DefaultSelector() as selector:
+                try:
+                    for port in ports[i:i + batch_size]:
+                        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RESET)
+                        sock.setblocking(False)
+                        error = sock.connect_ex((host, port))
+                        if error in _CONNECT_PENDING_ERRNOS:
+                            selector.register(sock, selectors.EVENT_WRITE, port)
+                            continue
+                        results[port] = error == 0
+                        sock.close()
+                    
+                    deadline = time.monotonic() + timeout
+                    while selector.get_map():
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        for key, _ in selector.select(remaining):
+                            # Writable means the connect finished; SO_ERROR says how
+                            sock = key.fileobj
+                            results[key.data] = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+                            selector.unregister(sock)
+                            sock.close()
+                finally:
+                    # Whatever is still pending timed out (filtered or unreachable),
+                    # or the batch was cut short by an error
+                    for key in list(selector.get_map().values()):
+                        selector.unregister(key.fileobj)
+                        key.fileobj.close()
+        
+        return results
+    
+    def get_port_info(
+        self, port: int, *, want_service: bool = True, want_listening: bool = False
+    ) -> Dict[str, any]:
         """
         Get comprehensive information about a port.
         
         Args:
             port: Port number
+            want_service: Look up the service name (reported as None otherwise)
+            want_listening: Probe used ports for a listening service; when
+                False they are reported as "in use" without the extra connect
             
         Returns:
             Dictionary with port information
         """
-        available = self.is_port_available(port)
-        service = self.get_service_name(port)
-        listening = self.check_port_connection(port) if not available else False
+        error = self._bind_error(port)
+        available = error is None
+        # Only connect when the bind failure says something may be listening
+        listening = want_listening and error in _PROBE_ERRNOS and self.check_port_connection(port)
+        service = self.get_service_name(port) if want_service else None
         
+        return self._build_info(port, available, service, listening)
+    
+    @staticmethod
+    def _build_info(port: int, available: bool, service: Optional[str], listening: bool) -> Dict[str, any]:
+        """Assemble the port information dictionary."""
         return {
             "port": port,
             "available": available,
@@ -92,23 +355,105 @@ class PortChecker:
             "status": "available" if available else ("listening" if listening else "in use")
         }
     
-    def find_first_available(self, start: int, end: int) -> Optional[int]:
+    def find_first_available(
+        self, start: int, end: int, strategy: Literal["linear", "random"] = "linear"
+    ) -> Optional[int]:
         """
         Find the first available port in a range.
         
         Args:
             start: Starting port number
             end: Ending port number
+            strategy: "linear" probes from start upwards and returns the lowest
+                available port; "random" probes in shuffled order, which finds
+                a free port faster when the low end of the range is busy
             
         Returns:
             First available port number, or None if no ports available
         """
-        for port in range(start, end + 1):
+        if strategy not in ("linear", "random"):
+            raise ValueError(f"Unknown strategy: {strategy!r}")
+        
+        ports = range(start, end + 1)
+        if strategy == "random":
+            ports = list(ports)
+            random.shuffle(ports)
+        
+        for port in ports:
             if self.is_port_available(port):
                 return port
         return None
     
-    def scan_range(self, start: int, end: int, detailed: bool = False) -> Tuple[List, List]:
+    def _bind_chunk(self, ports: range, stop: Optional[threading.Event] = None) -> bytes:
+        """
+        Bind-probe a run of ports; one byte per port, 1 if bindable.
+        
+        Once stop is set, the remaining ports are skipped and reported as
+        not bindable; callers setting it discard the result. The compiled
+        scanner always finishes its chunk, which takes microseconds per port.
+        """
+        if self._packed_host is not None:
+            return _scan.scan_bind_range(ports.start, ports.stop - 1, self._packed_host)
+        bind_error = self._bind_error
+        if stop is None:
+            return bytes(bind_error(port) is None for port in ports)
+        return bytes(not stop.is_set() and bind_error(port) is None for port in ports)
+    
+    def _detail_chunk(self, ports: range) -> List[Tuple[Optional[int], Optional[str]]]:
+        """Bind-probe a run of ports, returning (bind errno, service name) per port."""
+        return [(self._bind_error(port), self.get_service_name(port)) for port in ports]
+    
+    def find_available_ports(self, start: int, end: int, count: int) -> List[int]:
+        """
+        Find the lowest available ports in a range.
+        
+        Chunks of the range are probed concurrently and consumed in order, so
+        the result is the lowest available ports. Only a bounded window of
+        chunks is in flight: enough to cover count if every port were free,
+        plus FIND_LOOKAHEAD_CHUNKS, doubling whenever a consumed chunk leaves
+        the count short. Once enough are found, chunks that haven't started
+        are cancelled and running ones stop early.
+        
+        Args:
+            start: Starting port number
+            end: Ending port number
+            count: Number of available ports wanted
+            
+        Returns:
+            Up to count available ports, in ascending order
+        """
+        found = []
+        if count < 1:
+            return found
+        
+        all_chunks = _chunk_range(start, end)
+        chunks = iter(all_chunks)
+        max_window = min(MAX_SCAN_WORKERS, len(all_chunks))
+        window = min(max_window, -(-count // SCAN_CHUNK_SIZE) + FIND_LOOKAHEAD_CHUNKS)
+        stop = threading.Event()
+        
+        with ThreadPoolExecutor(max_workers=max_window) as executor:
+            pending = deque()
+            while True:
+                # Top up the in-flight window
+                for chunk in islice(chunks, window - len(pending)):
+                    pending.append((chunk, executor.submit(self._bind_chunk, chunk, stop)))
+                if not pending:
+                    break
+                
+                chunk, future = pending.popleft()
+                found.extend(compress(chunk, future.result()))
+                if len(found) >= count:
+                    break
+                window = min(max_window, window * 2)
+            
+            stop.set()
+            for _, future in pending:
+                future.cancel()
+        
+        return found[:count]
+    
+    def scan_range(self, start: int, end: int, detailed: bool = False) -> Tuple[Sequence, Sequence]:
         """
         Scan a range of ports and categorize them.
         
@@ -118,35 +463,54 @@ class PortChecker:
             detailed: Include detailed port information
             
         Returns:
-            Tuple of (available_ports, used_ports)
+            Tuple of (available_ports, used_ports); port numbers as
+            array('H') sequences, or lists of port info dicts if detailed
         """
         available = []
         used = []
         
         total = end - start + 1
-        for i, port in enumerate(range(start, end + 1), 1):
-            if detailed:
-                info = self.get_port_info(port)
-                if info["available"]:
+        show_progress = total > 100
+        chunks = _chunk_range(start, end)
+        # Flat result buffer for plain scans, one byte per port: 1 if bindable
+        results = [] if detailed else bytearray()
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_SCAN_WORKERS, len(chunks))) as executor:
+            probe = self._detail_chunk if detailed else self._bind_chunk
+            for chunk_result in executor.map(probe, chunks):
+                results += chunk_result
+                
+                # Progress indicator for large ranges
+                if show_progress:
+                    sys.stdout.write(f"Scanning... {len(results)}/{total} ports checked\r")
+                    sys.stdout.flush()
+        
+        ports = range(start, end + 1)
+        if detailed:
+            # Probe used ports for a listener in one concurrent batch
+            listening = self.check_ports_connection(
+                [port for port, (error, _) in zip(ports, results) if error in _PROBE_ERRNOS]
+            )
+            for port, (error, service) in zip(ports, results):
+                ok = error is None
+                info = self._build_info(port, ok, service, listening.get(port, False))
+                if ok:
                     available.append(info)
                 else:
                     used.append(info)
-            else:
-                if self.is_port_available(port):
-                    available.append(port)
-                else:
-                    used.append(port)
-            
-            # Progress indicator for large ranges
-            if total > 100 and i % 50 == 0:
-                print(f"Scanning... {i}/{total} ports checked", end='\r')
+        else:
+            # Partition in C: compress() selects ports whose byte is set, and
+            # translate() flips the buffer to select the used ones.
+            # Ports fit in unsigned shorts: 2 bytes each instead of an int object.
+            available = array.array('H', compress(ports, results))
+            used = array.array('H', compress(ports, results.translate(_INVERT_BITMAP)))
         
-        if total > 100:
-            print(" " * 50, end='\r')  # Clear progress line
+        if show_progress:
+            sys.stdout.write(" " * 50 + "\r")  # Clear progress line
         
         return available, used
     
-    def monitor_ports(self, ports: List[int], interval: int = 5, duration: int = 60):
+    def monitor_ports(self, ports: Sequence[int], interval: int = 5, duration: int = 60):
         """
         Monitor ports for changes over time.
         
@@ -158,28 +522,38 @@ class PortChecker:
         print(f"Monitoring {len(ports)} port(s) every {interval} seconds for {duration} seconds...")
         print("Press Ctrl+C to stop early\n")
         
-        start_time = time.time()
+        start_time = time.monotonic()
+        next_tick = start_time
         iteration = 0
         
         try:
-            while time.time() - start_time < duration:
+            while time.monotonic() - start_time < duration:
                 iteration += 1
-                timestamp = datetime.now().strftime("%H:%M:%S")
+                timestamp = time.strftime("%H:%M:%S", time.localtime())
                 print(f"[{timestamp}] Check #{iteration}")
                 
                 for port in ports:
-                    info = self.get_port_info(port)
+                    info = self.get_port_info(port, want_listening=True)
                     status_icon = "✓" if info["available"] else "✗"
                     service_info = f" ({info['service']})" if info['service'] else ""
                     print(f"  Port {port}: {status_icon} {info['status']}{service_info}")
                 
                 print()
-                time.sleep(interval)
+                # Fixed cadence: sleep until the next scheduled tick, so check
+                # duration doesn't accumulate as drift. If a check overran the
+                # interval, re-anchor the schedule at now rather than bursting
+                # through the missed ticks.
+                next_tick += interval
+                now = time.monotonic()
+                if next_tick < now:
+                    next_tick = now
+                time.sleep(next_tick - now)
                 
         except KeyboardInterrupt:
             print("\nMonitoring stopped by user")
 
 
+@lru_cache(maxsize=128)
 def validate_port_range(range_str: str) -> Tuple[int, int]:
     """
     Validate and parse port range string.
@@ -212,7 +586,8 @@ def validate_port_range(range_str: str) -> Tuple[int, int]:
         raise ValueError(f"Invalid port range: {e}")
 
 
-def parse_port_list(port_str: str) -> List[int]:
+@lru_cache(maxsize=128)
+def parse_port_list(port_str: str) -> Tuple[int, ...]:
     """
     Parse comma-separated port list.
     
@@ -220,7 +595,7 @@ def parse_port_list(port_str: str) -> List[int]:
         port_str: Comma-separated port numbers
         
     Returns:
-        List of port numbers
+        Tuple of port numbers (immutable, as results are cached)
     """
     ports = []
     for part in port_str.split(","):
@@ -233,13 +608,17 @@ def parse_port_list(port_str: str) -> List[int]:
             if port < 1 or port > 65535:
                 raise ValueError(f"Port {port} out of valid range (1-65535)")
             ports.append(port)
-    return ports
+    return tuple(ports)
 
 
 def export_results(data: Dict, filename: str):
     """Export scan results to JSON file."""
-    with open(filename, 'w') as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w') as f:
+            json.dump(data, f, indent=2)
     print(f"\nResults exported to {filename}")
 
 
@@ -250,8 +629,10 @@ def main():
         epilog="""
 Examples:
   %(prog)s --range 8000-9000
+  %(prog)s --range 8000-9000 --random
   %(prog)s --range 3000-3010 --list
   %(prog)s --check 80,443,8080
+  %(prog)s --check 80,443,8080 --detailed
   %(prog)s --range 8000-8100 --detailed
   %(prog)s --monitor 8000,8080 --interval 10
   %(prog)s --range 3000-3100 --export results.json
@@ -325,6 +706,14 @@ Examples:
         help="Monitoring duration in seconds (default: 60)"
     )
     
+    parser.add_argument(
+        "--random",
+        action="store_true",
+        help="Pick a random available port instead of the lowest one "
+             "(single-port mode only; not with --list, --count, --check, "
+             "--common or --monitor)"
+    )
+    
     parser.add_argument(
         "--export",
         type=str,
@@ -334,6 +723,16 @@ Examples:
     
     args = parser.parse_args()
     
+    if args.random:
+        conflicting = [
+            flag for flag, value in (
+                ("--list", args.list), ("--count", args.count), ("--check", args.check),
+                ("--common", args.common), ("--monitor", args.monitor),
+            ) if value
+        ]
+        if conflicting:
+            parser.error(f"--random cannot be combined with {', '.join(conflicting)}")
+    
     checker = PortChecker(host=args.host)
     
     # Monitor mode
@@ -348,21 +747,13 @@ Examples:
     
     # Common ports check
     if args.common:
-        common_ports = {
-            20: "FTP Data", 21: "FTP Control", 22: "SSH", 23: "Telnet",
-            25: "SMTP", 53: "DNS", 80: "HTTP", 110: "POP3", 143: "IMAP",
-            443: "HTTPS", 465: "SMTPS", 587: "SMTP (submission)",
-            993: "IMAPS", 995: "POP3S", 3306: "MySQL", 5432: "PostgreSQL",
-            6379: "Redis", 8080: "HTTP Alt", 27017: "MongoDB"
-        }
-        
         print("Checking common service ports...\n")
         print(f"{'Port':<8} {'Service':<20} {'Status':<15} {'Listening'}")
         print("=" * 60)
         
         results = []
-        for port, service in sorted(common_ports.items()):
-            info = checker.get_port_info(port)
+        for port, service in COMMON_PORTS.items():
+            info = checker.get_port_info(port, want_listening=True)
             status_icon = "✓" if info["available"] else "✗"
             listen_icon = "●" if info["listening"] else "○"
             print(f"{port:<8} {service:<20} {status_icon} {info['status']:<13} {listen_icon}")
@@ -379,12 +770,14 @@ Examples:
             print(f"Checking {len(ports)} port(s)...\n")
             
             results = []
+            lines = []
             for port in ports:
-                info = checker.get_port_info(port)
+                info = checker.get_port_info(port, want_service=args.detailed, want_listening=True)
                 status_icon = "✓" if info["available"] else "✗"
                 service_info = f" ({info['service']})" if info['service'] else ""
-                print(f"Port {port}: {status_icon} {info['status']}{service_info}")
+                lines.append(f"Port {port}: {status_icon} {info['status']}{service_info}")
                 results.append(info)
+            sys.stdout.write("\n".join(lines) + "\n")
             
             if args.export:
                 export_results({"checked_ports": results, "timestamp": datetime.now().isoformat()}, args.export)
@@ -412,12 +805,14 @@ Examples:
         print(f"Available Ports ({len(available)})")
         print("=" * 50)
         if available:
-            for item in available:
-                if args.detailed:
-                    service = f" ({item['service']})" if item['service'] else ""
-                    print(f"  {item['port']}{service}")
-                else:
-                    print(f"  {item}")
+            if args.detailed:
+                lines = [
+                    f"  {item['port']}" + (f" ({item['service']})" if item['service'] else "")
+                    for item in available
+                ]
+            else:
+                lines = [f"  {item}" for item in available]
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             print("  None")
         
@@ -425,13 +820,15 @@ Examples:
         print(f"Used Ports ({len(used)})")
         print("=" * 50)
         if used:
-            for item in used:
-                if args.detailed:
-                    service = f" ({item['service']})" if item['service'] else ""
-                    status = f" [{item['status']}]"
-                    print(f"  {item['port']}{service}{status}")
-                else:
-                    print(f"  {item}")
+            if args.detailed:
+                lines = [
+                    f"  {item['port']}" + (f" ({item['service']})" if item['service'] else "")
+                    + f" [{item['status']}]"
+                    for item in used
+                ]
+            else:
+                lines = [f"  {item}" for item in used]
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             print("  None")
         
@@ -440,19 +837,14 @@ Examples:
         if args.export:
             export_results({
                 "range": f"{start}-{end}",
-                "available": available,
-                "used": used,
+                "available": list(available),
+                "used": list(used),
                 "timestamp": datetime.now().isoformat()
             }, args.export)
     
     elif args.count:
         print(f"Finding {args.count} available ports in range {start}-{end}...")
-        found = []
-        for port in range(start, end + 1):
-            if checker.is_port_available(port):
-                found.append(port)
-                if len(found) >= args.count:
-                    break
+        found = checker.find_available_ports(start, end, args.count)
         
         if found:
             print(f"\nFound {len(found)} available port(s):")
@@ -470,10 +862,12 @@ Examples:
             sys.exit(1)
     
     else:
-        port = checker.find_first_available(start, end)
+        port = checker.find_first_available(start, end, "random" if args.random else "linear")
         if port is None:
             print(f"No available ports in range {start}-{end}")
             sys.exit(1)
+        elif args.random:
+            print(f"Available port: {port}")
         else:
             print(f"First available port: {port}")
 